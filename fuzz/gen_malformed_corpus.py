@@ -8,225 +8,114 @@ Creates test cases with:
 - Huge sizes (bigger than buffer)
 - Size that would overflow when added to offset
 - Sizes that point just past valid data
+
+The seeds themselves live in the riff_seeds package, one module per
+category (see riff_seeds.CATEGORIES).  --category limits generation to
+the named categories, and --jobs assembles categories in parallel
+worker processes.
+
+By default each seed is written as its own file in the output directory,
+which is what libFuzzer expects when given a corpus directory.  With
+--zip, all seeds are stored in a single riff_parser_seed_corpus.zip in
+the output directory instead, the layout OSS-Fuzz/ClusterFuzzLite use
+for seed corpora.
+
+Directory output is incremental: a manifest of payload digests is kept
+beside the corpus directory (riff_parser.manifest.json for a corpus in
+riff_parser/), and seeds whose file already holds the expected bytes are
+not rewritten.  The manifest lives outside the directory so libFuzzer
+never picks it up as a seed.
+
+--stream skips the filesystem entirely: "tar" writes the seeds to stdout
+as a tar stream, and "zmq" pushes each seed as a [name, payload]
+multipart message to the ZeroMQ endpoint given by --zmq-url (requires
+pyzmq).  Progress output goes to stderr in streaming modes.
 """
 
+import argparse
+import multiprocessing
 import os
-import struct
 import sys
 
-# Output directory: command-line arg or default to script location
-if len(sys.argv) > 1:
-    CORPUS_DIR = sys.argv[1]
-else:
-    CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus", "riff_parser")
-
-os.makedirs(CORPUS_DIR, exist_ok=True)
-
-def write_corpus(name, data):
-    """Write a corpus file."""
-    path = os.path.join(CORPUS_DIR, name)
-    with open(path, "wb") as f:
-        f.write(data)
-    print(f"  {name}: {len(data)} bytes")
-
-def u32le(val):
-    """Pack as little-endian uint32."""
-    return struct.pack("<I", val & 0xFFFFFFFF)
-
-def fourcc(s):
-    """Create FourCC from string."""
-    return s.encode("ascii")
-
-# RIFF header: "RIFF" + size + form_type
-# Chunk header: fourcc + size
-# CNFG payload: int_size(1) + ptr_size(1) + endianness(1) + reserved(1) = 4 bytes
-
-print("Generating malformed corpus files...")
-
-# --- RIFF size edge cases ---
-
-# RIFF with size = 0 (too small for form type)
-write_corpus("malformed_riff_size_zero",
-    fourcc("RIFF") + u32le(0) + fourcc("SEMI"))
-
-# RIFF with size = -1 (0xFFFFFFFF)
-write_corpus("malformed_riff_size_neg1",
-    fourcc("RIFF") + u32le(0xFFFFFFFF) + fourcc("SEMI"))
-
-# RIFF with size = 4 (just form type, no chunks) - valid edge case
-write_corpus("malformed_riff_size_min",
-    fourcc("RIFF") + u32le(4) + fourcc("SEMI"))
-
-# RIFF with size bigger than buffer (claims 1000 bytes but only 12 present)
-write_corpus("malformed_riff_size_huge",
-    fourcc("RIFF") + u32le(1000) + fourcc("SEMI"))
-
-# RIFF with size that would overflow: 0xFFFFFFF0 + 8 = wrap around
-write_corpus("malformed_riff_size_overflow",
-    fourcc("RIFF") + u32le(0xFFFFFFF0) + fourcc("SEMI"))
-
-
-# --- Chunk size edge cases ---
-
-# CNFG chunk with size = 0 (no payload)
-write_corpus("malformed_cnfg_size_zero",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(0))
-
-# CNFG chunk with size = -1
-write_corpus("malformed_cnfg_size_neg1",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(0xFFFFFFFF))
-
-# CNFG chunk with size bigger than remaining buffer
-write_corpus("malformed_cnfg_size_huge",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(1000) + bytes([4, 4, 0, 0]))
-
-# CNFG chunk with size = 3 (odd, needs padding check)
-write_corpus("malformed_cnfg_size_odd",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(3) + bytes([4, 4, 0]))
-
-
-# --- CALL chunk with sub-chunk size issues ---
-
-# CALL with size = 0 (no opcode header)
-write_corpus("malformed_call_size_zero",
-    fourcc("RIFF") + u32le(20) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(0))
-
-# CALL with size = -1
-write_corpus("malformed_call_size_neg1",
-    fourcc("RIFF") + u32le(20) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(0xFFFFFFFF) + bytes([0x01, 0, 0, 0]))
-
-# CALL with PARM sub-chunk that has size = -1
-write_corpus("malformed_parm_size_neg1",
-    fourcc("RIFF") + u32le(36) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(16) + bytes([0x01, 0, 0, 0]) +  # opcode header
-    fourcc("PARM") + u32le(0xFFFFFFFF) + bytes([0, 0, 0, 0, 0x42, 0, 0, 0]))
-
-# CALL with PARM that claims more than remaining CALL data
-write_corpus("malformed_parm_size_overflow",
-    fourcc("RIFF") + u32le(36) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(16) + bytes([0x01, 0, 0, 0]) +
-    fourcc("PARM") + u32le(1000) + bytes([0, 0, 0, 0, 0x42, 0, 0, 0]))
-
-
-# --- DATA chunk size issues ---
-
-# DATA with size = -1
-write_corpus("malformed_data_size_neg1",
-    fourcc("RIFF") + u32le(36) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(16) + bytes([0x01, 0, 0, 0]) +
-    fourcc("DATA") + u32le(0xFFFFFFFF) + bytes([0, 0, 0, 0]) + b"hello")
-
-# DATA with size = 0 (empty data)
-write_corpus("malformed_data_size_zero",
-    fourcc("RIFF") + u32le(28) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(12) + bytes([0x01, 0, 0, 0]) +
-    fourcc("DATA") + u32le(0))
-
-
-# --- RETN chunk size issues ---
-
-# RETN with size = 0
-write_corpus("malformed_retn_size_zero",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("RETN") + u32le(0))
-
-# RETN with size = -1
-write_corpus("malformed_retn_size_neg1",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("RETN") + u32le(0xFFFFFFFF) + bytes([0, 0, 0, 0, 0, 0, 0, 0]))
-
-# RETN with size = 4 (missing errno)
-write_corpus("malformed_retn_size_short",
-    fourcc("RIFF") + u32le(16) + fourcc("SEMI") +
-    fourcc("RETN") + u32le(4) + bytes([0, 0, 0, 0]))
-
-
-# --- ERRO chunk size issues ---
-
-# ERRO with size = 0
-write_corpus("malformed_erro_size_zero",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("ERRO") + u32le(0))
-
-# ERRO with size = 1 (too small for error code)
-write_corpus("malformed_erro_size_one",
-    fourcc("RIFF") + u32le(14) + fourcc("SEMI") +
-    fourcc("ERRO") + u32le(1) + bytes([0x01, 0]))
-
-# ERRO with size = -1
-write_corpus("malformed_erro_size_neg1",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("ERRO") + u32le(0xFFFFFFFF))
-
-
-# --- Nested container issues ---
-
-# Multiple chunks where second chunk's offset + size wraps
-write_corpus("malformed_multi_chunk_wrap",
-    fourcc("RIFF") + u32le(24) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]) +
-    fourcc("CALL") + u32le(0x7FFFFFFF))  # huge size
-
-# Chunk that ends exactly at buffer end
-write_corpus("malformed_chunk_exact_end",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 4, 0, 0]))
-
-# Chunk header present but no room for payload
-write_corpus("malformed_chunk_header_only",
-    fourcc("RIFF") + u32le(8) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4))  # claims 4 bytes but nothing follows
-
-
-# --- Integer boundary cases for int_size parsing ---
-
-# CNFG with int_size = 0
-write_corpus("malformed_cnfg_int_size_zero",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([0, 4, 0, 0]))  # int_size=0
-
-# CNFG with int_size = 255
-write_corpus("malformed_cnfg_int_size_huge",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([255, 4, 0, 0]))  # int_size=255
-
-# CNFG with ptr_size = 0
-write_corpus("malformed_cnfg_ptr_size_zero",
-    fourcc("RIFF") + u32le(12) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 0, 0, 0]))  # ptr_size=0
-
-
-# --- Malformed CNFG + CALL combinations (triggers response writing) ---
-
-# CNFG with huge int_size + valid CALL (triggers write_retn overflow)
-write_corpus("malformed_cnfg_huge_with_call",
-    fourcc("RIFF") + u32le(28) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([255, 4, 0, 0]) +  # int_size=255
-    fourcc("CALL") + u32le(4) + bytes([0x13, 0, 0, 0]))  # SYS_ERRNO opcode
-
-# CNFG with int_size=0 + valid CALL
-write_corpus("malformed_cnfg_zero_with_call",
-    fourcc("RIFF") + u32le(28) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([0, 4, 0, 0]) +  # int_size=0
-    fourcc("CALL") + u32le(4) + bytes([0x13, 0, 0, 0]))  # SYS_ERRNO opcode
-
-# CNFG with ptr_size=0 + valid CALL
-write_corpus("malformed_cnfg_ptr_zero_with_call",
-    fourcc("RIFF") + u32le(28) + fourcc("SEMI") +
-    fourcc("CNFG") + u32le(4) + bytes([4, 0, 0, 0]) +  # ptr_size=0
-    fourcc("CALL") + u32le(4) + bytes([0x13, 0, 0, 0]))  # SYS_ERRNO opcode
-
-
-print(f"\nGenerated files in {CORPUS_DIR}")
+from riff_seeds import CATEGORIES
+from riff_seeds.emit import (ZIP_NAME, build_category, dedup_seeds, emit_dir,
+                             emit_zip, stream_tar, stream_zmq)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0])
+    parser.add_argument("corpus_dir", nargs="?",
+        default=os.path.join(os.path.dirname(__file__),
+                             "corpus", "riff_parser"),
+        help="output directory (default: corpus/riff_parser next to this "
+             "script)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--zip", action="store_true",
+        help="write %s instead of individual files" % ZIP_NAME)
+    output.add_argument("--stream", choices=("tar", "zmq"),
+        help="send seeds to stdout as tar, or over ZeroMQ, instead of "
+             "writing corpus_dir")
+    parser.add_argument("--zmq-url", metavar="URL",
+        help="ZeroMQ endpoint to PUSH seeds to with --stream zmq")
+    parser.add_argument("--category", action="append", choices=CATEGORIES,
+        help="only generate this category (repeatable; default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+        help="assemble categories in N worker processes (default: 1)")
+    args = parser.parse_args()
+
+    if args.stream == "zmq":
+        if not args.zmq_url:
+            parser.error("--stream zmq requires --zmq-url")
+        try:
+            import zmq  # noqa: F401
+        except ImportError:
+            parser.error("--stream zmq requires pyzmq")
+
+    corpus_dir = args.corpus_dir
+    # stdout carries the tar stream, so chatter goes to stderr
+    log = sys.stderr if args.stream else sys.stdout
+
+    categories = args.category or CATEGORIES
+    if args.jobs > 1:
+        with multiprocessing.Pool(min(args.jobs, len(categories))) as pool:
+            per_category = pool.map(build_category, categories)
+    else:
+        per_category = [build_category(name) for name in categories]
+    seeds, duplicates = dedup_seeds(
+        [seed for group in per_category for seed in group])
+    unchanged = set()
+    if args.stream == "tar":
+        stream_tar(seeds, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    elif args.stream == "zmq":
+        stream_zmq(seeds, args.zmq_url)
+    elif args.zip:
+        os.makedirs(corpus_dir, exist_ok=True)
+        zip_path = emit_zip(corpus_dir, seeds)
+    else:
+        unchanged = emit_dir(corpus_dir, seeds)
+
+    # Report after the writes so the listing stays in category order, and
+    # hand it to the stream in one write rather than a syscall per line
+    report = ["Generating malformed corpus files...\n"]
+    for name, data in seeds:
+        note = " (unchanged)" if name in unchanged else ""
+        report.append(f"  {name}: {len(data)} bytes{note}\n")
+    for name in duplicates:
+        report.append(f"  {name}: duplicate payload, skipped\n")
+
+    if args.stream == "tar":
+        report.append("\nStreamed corpus to stdout as tar\n")
+    elif args.stream == "zmq":
+        report.append(f"\nStreamed corpus to {args.zmq_url}\n")
+    elif args.zip:
+        report.append(f"\nGenerated {zip_path}\n")
+    else:
+        report.append(f"\nGenerated files in {corpus_dir}\n")
+    log.write("".join(report))
+    log.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Malformed RIFF seeds for the fuzz_riff_parser corpus, by category.
+
+Each category module exports a SPECS list of (file name, payload parts)
+and a main(out_dir) that writes just that category's seeds, so a single
+family can be regenerated on its own:
+
+    python3 -m riff_seeds.call_subchunks out_dir
+
+A bytes part is copied as is; an int part is a little-endian uint32
+field (a RIFF or chunk size).  gen_malformed_corpus.py combines every
+category listed in CATEGORIES.
+"""
+
+import importlib
+import struct
+
+# Category modules, in the order their seeds are emitted
+CATEGORIES = ("riff_sizes", "chunk_sizes", "call_subchunks", "cnfg_fields")
+
+# Little-endian uint32, the encoding of every RIFF and chunk size field
+U32 = struct.Struct("<I")
+
+# FourCCs used by the seeds
+RIFF = b"RIFF"
+SEMI = b"SEMI"
+CNFG = b"CNFG"
+CALL = b"CALL"
+DATA = b"DATA"
+RETN = b"RETN"
+ERRO = b"ERRO"
+PARM = b"PARM"
+
+# RIFF header: "RIFF" + size + form_type
+# Chunk header: fourcc + size
+# CNFG payload: int_size(1) + ptr_size(1) + endianness(1) + reserved(1) = 4 bytes
+
+def riff_cnfg_prefix(riff_size):
+    """RIFF header claiming riff_size, followed by a valid 4/4/LE CNFG chunk."""
+    return b"".join((RIFF, U32.pack(riff_size), SEMI,
+                     CNFG, U32.pack(4), b"\x04\x04\x00\x00"))
+
+
+def load_category(name):
+    """Import and return the category module called name."""
+    if name not in CATEGORIES:
+        raise ValueError(f"unknown seed category: {name}")
+    return importlib.import_module(f"{__name__}.{name}")
@@ -0,0 +1,59 @@
+"""CALL chunks and their PARM/DATA sub-chunks with bad sizes."""
+
+import sys
+
+from . import CALL, DATA, PARM, riff_cnfg_prefix
+from .emit import build_seeds, emit_dir
+
+# Prefixes shared by several of the CALL/PARM/DATA seeds
+_PREFIX_20 = riff_cnfg_prefix(20)
+_PREFIX_28 = riff_cnfg_prefix(28)
+_PREFIX_36 = riff_cnfg_prefix(36)
+
+SPECS = [
+    # --- CALL chunk with sub-chunk size issues ---
+
+    # CALL with size = 0 (no opcode header)
+    ("malformed_call_size_zero",
+     (_PREFIX_20, CALL, 0)),
+
+    # CALL with size = -1
+    ("malformed_call_size_neg1",
+     (_PREFIX_20, CALL, 0xFFFFFFFF, b"\x01\x00\x00\x00")),
+
+    # CALL with PARM sub-chunk that has size = -1
+    ("malformed_parm_size_neg1",
+     (_PREFIX_36,
+      CALL, 16, b"\x01\x00\x00\x00",  # opcode header
+      PARM, 0xFFFFFFFF, b"\x00\x00\x00\x00\x42\x00\x00\x00")),
+
+    # CALL with PARM that claims more than remaining CALL data
+    ("malformed_parm_size_overflow",
+     (_PREFIX_36,
+      CALL, 16, b"\x01\x00\x00\x00",
+      PARM, 1000, b"\x00\x00\x00\x00\x42\x00\x00\x00")),
+
+
+    # --- DATA chunk size issues ---
+
+    # DATA with size = -1
+    ("malformed_data_size_neg1",
+     (_PREFIX_36,
+      CALL, 16, b"\x01\x00\x00\x00",
+      DATA, 0xFFFFFFFF, b"\x00\x00\x00\x00", b"hello")),
+
+    # DATA with size = 0 (empty data)
+    ("malformed_data_size_zero",
+     (_PREFIX_28,
+      CALL, 12, b"\x01\x00\x00\x00",
+      DATA, 0)),
+]
+
+
+def main(out_dir):
+    """Write this category's seeds into out_dir."""
+    emit_dir(out_dir, build_seeds(SPECS))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
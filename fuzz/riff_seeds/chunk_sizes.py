@@ -0,0 +1,92 @@
+"""Top-level chunk size edge cases: CNFG, RETN, ERRO and chunks that
+overrun or exactly fill the RIFF container."""
+
+import sys
+
+from . import RIFF, SEMI, CNFG, CALL, RETN, ERRO, riff_cnfg_prefix
+from .emit import build_seeds, emit_dir
+
+SPECS = [
+    # --- Chunk size edge cases ---
+
+    # CNFG chunk with size = 0 (no payload)
+    ("malformed_cnfg_size_zero",
+     (RIFF, 12, SEMI,
+      CNFG, 0)),
+
+    # CNFG chunk with size = -1
+    ("malformed_cnfg_size_neg1",
+     (RIFF, 12, SEMI,
+      CNFG, 0xFFFFFFFF)),
+
+    # CNFG chunk with size bigger than remaining buffer
+    ("malformed_cnfg_size_huge",
+     (RIFF, 12, SEMI,
+      CNFG, 1000, b"\x04\x04\x00\x00")),
+
+    # CNFG chunk with size = 3 (odd, needs padding check)
+    ("malformed_cnfg_size_odd",
+     (RIFF, 12, SEMI,
+      CNFG, 3, b"\x04\x04\x00")),
+
+
+    # --- RETN chunk size issues ---
+
+    # RETN with size = 0
+    ("malformed_retn_size_zero",
+     (RIFF, 12, SEMI,
+      RETN, 0)),
+
+    # RETN with size = -1
+    ("malformed_retn_size_neg1",
+     (RIFF, 12, SEMI,
+      RETN, 0xFFFFFFFF, b"\x00\x00\x00\x00\x00\x00\x00\x00")),
+
+    # RETN with size = 4 (missing errno)
+    ("malformed_retn_size_short",
+     (RIFF, 16, SEMI,
+      RETN, 4, b"\x00\x00\x00\x00")),
+
+
+    # --- ERRO chunk size issues ---
+
+    # ERRO with size = 0
+    ("malformed_erro_size_zero",
+     (RIFF, 12, SEMI,
+      ERRO, 0)),
+
+    # ERRO with size = 1 (too small for error code)
+    ("malformed_erro_size_one",
+     (RIFF, 14, SEMI,
+      ERRO, 1, b"\x01\x00")),
+
+    # ERRO with size = -1
+    ("malformed_erro_size_neg1",
+     (RIFF, 12, SEMI,
+      ERRO, 0xFFFFFFFF)),
+
+
+    # --- Nested container issues ---
+
+    # Multiple chunks where second chunk's offset + size wraps
+    ("malformed_multi_chunk_wrap",
+     (riff_cnfg_prefix(24), CALL, 0x7FFFFFFF)),  # huge size
+
+    # Chunk that ends exactly at buffer end
+    ("malformed_chunk_exact_end",
+     (riff_cnfg_prefix(12),)),
+
+    # Chunk header present but no room for payload
+    ("malformed_chunk_header_only",
+     (RIFF, 8, SEMI,
+      CNFG, 4)),  # claims 4 bytes but nothing follows
+]
+
+
+def main(out_dir):
+    """Write this category's seeds into out_dir."""
+    emit_dir(out_dir, build_seeds(SPECS))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
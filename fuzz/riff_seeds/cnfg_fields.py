@@ -0,0 +1,56 @@
+"""CNFG field values (int_size, ptr_size) out of range, alone and
+followed by a CALL that makes the host write a response."""
+
+import sys
+
+from . import RIFF, SEMI, CNFG, CALL
+from .emit import build_seeds, emit_dir
+
+SPECS = [
+    # --- Integer boundary cases for int_size parsing ---
+
+    # CNFG with int_size = 0
+    ("malformed_cnfg_int_size_zero",
+     (RIFF, 12, SEMI,
+      CNFG, 4, b"\x00\x04\x00\x00")),  # int_size=0
+
+    # CNFG with int_size = 255
+    ("malformed_cnfg_int_size_huge",
+     (RIFF, 12, SEMI,
+      CNFG, 4, b"\xff\x04\x00\x00")),  # int_size=255
+
+    # CNFG with ptr_size = 0
+    ("malformed_cnfg_ptr_size_zero",
+     (RIFF, 12, SEMI,
+      CNFG, 4, b"\x04\x00\x00\x00")),  # ptr_size=0
+
+
+    # --- Malformed CNFG + CALL combinations (triggers response writing) ---
+
+    # CNFG with huge int_size + valid CALL (triggers write_retn overflow)
+    ("malformed_cnfg_huge_with_call",
+     (RIFF, 28, SEMI,
+      CNFG, 4, b"\xff\x04\x00\x00",  # int_size=255
+      CALL, 4, b"\x13\x00\x00\x00")),  # SYS_ERRNO opcode
+
+    # CNFG with int_size=0 + valid CALL
+    ("malformed_cnfg_zero_with_call",
+     (RIFF, 28, SEMI,
+      CNFG, 4, b"\x00\x04\x00\x00",  # int_size=0
+      CALL, 4, b"\x13\x00\x00\x00")),  # SYS_ERRNO opcode
+
+    # CNFG with ptr_size=0 + valid CALL
+    ("malformed_cnfg_ptr_zero_with_call",
+     (RIFF, 28, SEMI,
+      CNFG, 4, b"\x04\x00\x00\x00",  # ptr_size=0
+      CALL, 4, b"\x13\x00\x00\x00")),  # SYS_ERRNO opcode
+]
+
+
+def main(out_dir):
+    """Write this category's seeds into out_dir."""
+    emit_dir(out_dir, build_seeds(SPECS))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,188 @@
+"""Seed assembly and the corpus output formats shared by every category."""
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from . import U32, load_category
+
+ZIP_NAME = "riff_parser_seed_corpus.zip"
+
+# Scratch buffer every seed is assembled in; grows if a seed outgrows it
+_SCRATCH = bytearray(128)
+
+
+def put_u32(off, val):
+    """Store a little-endian uint32 at off in the scratch buffer."""
+    if off + 4 > len(_SCRATCH):
+        _SCRATCH.extend(bytes(off + 4 - len(_SCRATCH)))
+    U32.pack_into(_SCRATCH, off, val)
+    return off + 4
+
+
+def put_bytes(off, data):
+    """Store data at off in the scratch buffer."""
+    _SCRATCH[off:off + len(data)] = data
+    return off + len(data)
+
+
+def assemble(parts):
+    """Build one seed payload from its SPECS parts."""
+    off = 0
+    for part in parts:
+        if isinstance(part, int):
+            off = put_u32(off, part)
+        else:
+            off = put_bytes(off, part)
+    return bytes(_SCRATCH[:off])
+
+
+def build_seeds(specs):
+    """Assemble specs into (name, payload) pairs."""
+    return [(name, assemble(parts)) for name, parts in specs]
+
+
+def build_category(name):
+    """Assemble the seeds of the category module called name."""
+    return build_seeds(load_category(name).SPECS)
+
+
+def dedup_seeds(seeds):
+    """Drop seeds whose payload repeats an earlier one.
+
+    Returns the seeds to emit and the names that were dropped; different
+    names with identical bytes add nothing to the corpus.
+    """
+    unique = []
+    duplicates = []
+    seen = set()
+    for name, data in seeds:
+        digest = hashlib.sha1(data).digest()
+        if digest in seen:
+            duplicates.append(name)
+            continue
+        seen.add(digest)
+        unique.append((name, data))
+    return unique, duplicates
+
+
+def seed_digest(data):
+    """Hex digest recorded in the manifest for a payload."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_manifest(manifest_path):
+    """Return the name -> digest map from a previous run, or {} if none."""
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_current(corpus_dir, name, data, digest, manifest):
+    """True if the corpus file already holds this payload."""
+    path = os.path.join(corpus_dir, name)
+    return (manifest.get(name) == digest and os.path.exists(path) and
+            os.path.getsize(path) == len(data))
+
+
+# Raw os.open() flags for seed files; O_BINARY keeps Windows from
+# translating newline bytes in the payload
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                getattr(os, "O_BINARY", 0))
+
+
+def write_corpus(corpus_dir, name, data, dir_fd=None):
+    """Write a corpus file.
+
+    Seeds are a few dozen bytes, so this goes straight to os.open/os.write
+    rather than through the buffered io stack.  If dir_fd is an open
+    descriptor for corpus_dir, name is resolved relative to it.
+    """
+    if dir_fd is not None:
+        fd = os.open(name, _WRITE_FLAGS, 0o644, dir_fd=dir_fd)
+    else:
+        fd = os.open(os.path.join(corpus_dir, name), _WRITE_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def emit_zip(corpus_dir, seeds):
+    """Store all seeds in one archive in corpus_dir; return its path."""
+    zip_path = os.path.join(corpus_dir, ZIP_NAME)
+    with zipfile.ZipFile(zip_path, "w",
+                         compression=zipfile.ZIP_STORED) as corpus_zip:
+        for name, data in seeds:
+            corpus_zip.writestr(name, data)
+    return zip_path
+
+
+def emit_dir(corpus_dir, seeds):
+    """Write seeds as files in corpus_dir; return the names left as is."""
+    os.makedirs(corpus_dir, exist_ok=True)
+    manifest_path = os.path.normpath(corpus_dir) + ".manifest.json"
+    manifest = load_manifest(manifest_path)
+    digests = {name: seed_digest(data) for name, data in seeds}
+    unchanged = set()
+    stale = []
+    for name, data in seeds:
+        if is_current(corpus_dir, name, data, digests[name], manifest):
+            unchanged.add(name)
+        else:
+            stale.append((name, data))
+
+    # Resolve the directory once instead of once per seed, where the
+    # platform lets os.open() take a dir_fd (Linux, macOS, BSD)
+    dir_fd = None
+    if os.open in os.supports_dir_fd:
+        dir_fd = os.open(corpus_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        # The seeds are tiny, so the cost is per-file syscalls; overlap them
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda seed: write_corpus(corpus_dir, *seed, dir_fd=dir_fd),
+                stale))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    # Merge rather than replace, so categories generated separately into
+    # the same directory keep each other's entries
+    updated = dict(manifest, **digests)
+    if updated != manifest:
+        with open(manifest_path, "w") as f:
+            f.write(json.dumps(updated, indent=2, sort_keys=True) + "\n")
+    return unchanged
+
+
+def stream_tar(seeds, fileobj):
+    """Write seeds to fileobj as an uncompressed tar stream."""
+    with tarfile.open(fileobj=fileobj, mode="w|") as tf:
+        for name, data in seeds:
+            tarinfo = tarfile.TarInfo(name)
+            tarinfo.size = len(data)
+            tarinfo.mode = 0o644
+            tf.addfile(tarinfo, io.BytesIO(data))
+
+
+def stream_zmq(seeds, url):
+    """Push each seed to url as a [name, payload] multipart message."""
+    import zmq
+
+    context = zmq.Context()
+    socket = context.socket(zmq.PUSH)
+    try:
+        socket.connect(url)
+        for name, data in seeds:
+            socket.send_multipart([name.encode(), data])
+    finally:
+        # Linger so queued seeds are delivered before the context goes away
+        socket.close(linger=-1)
+        context.term()
@@ -0,0 +1,39 @@
+"""RIFF header size edge cases."""
+
+import sys
+
+from . import RIFF, SEMI
+from .emit import build_seeds, emit_dir
+
+SPECS = [
+    # --- RIFF size edge cases ---
+
+    # RIFF with size = 0 (too small for form type)
+    ("malformed_riff_size_zero",
+     (RIFF, 0, SEMI)),
+
+    # RIFF with size = -1 (0xFFFFFFFF)
+    ("malformed_riff_size_neg1",
+     (RIFF, 0xFFFFFFFF, SEMI)),
+
+    # RIFF with size = 4 (just form type, no chunks) - valid edge case
+    ("malformed_riff_size_min",
+     (RIFF, 4, SEMI)),
+
+    # RIFF with size bigger than buffer (claims 1000 bytes but only 12 present)
+    ("malformed_riff_size_huge",
+     (RIFF, 1000, SEMI)),
+
+    # RIFF with size that would overflow: 0xFFFFFFF0 + 8 = wrap around
+    ("malformed_riff_size_overflow",
+     (RIFF, 0xFFFFFFF0, SEMI)),
+]
+
+
+def main(out_dir):
+    """Write this category's seeds into out_dir."""
+    emit_dir(out_dir, build_seeds(SPECS))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])